@@ -26,21 +26,24 @@ class ActionWithDirection(Action):
 
         self.dx = dx
         self.dy = dy
+        # Actions are performed right after they're created, so the destination is only computed once.
+        self.dest_x = entity.x + dx
+        self.dest_y = entity.y + dy
 
     @property
     def dest_xy(self) -> Tuple[int, int]:
         """Returns this actions destination."""
-        return self.entity.x + self.dx, self.entity.y + self.dy
+        return self.dest_x, self.dest_y
 
     @property
     def blocking_entity(self) -> Optional[game.entity.Entity]:
         """Return the blocking entity at this actions destination.."""
-        return g.engine.gamemap.get_blocking_entity_at(*self.dest_xy)
+        return g.engine.gamemap.get_blocking_entity_at(self.dest_x, self.dest_y)
 
     @property
     def target_actor(self) -> Optional[game.entity.Actor]:
         """Return the actor at this actions destination."""
-        return g.engine.gamemap.get_actor_at_location(*self.dest_xy)
+        return g.engine.gamemap.get_actor_at_location(self.dest_x, self.dest_y)
 
     def perform(self) -> None:
         raise NotImplementedError()
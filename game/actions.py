@@ -19,17 +19,13 @@ class Wait(Action):
 
 class Move(ActionWithDirection):
     def perform(self) -> None:
-        dest_x = self.entity.x + self.dx
-        dest_y = self.entity.y + self.dy
-
-        if not g.engine.gamemap.in_bounds(dest_x, dest_y):
-            raise game.exceptions.Impossible("That way is blocked.")  # Destination is out of bounds.
-        if not g.engine.gamemap.tiles[dest_x, dest_y]:
-            raise game.exceptions.Impossible("That way is blocked.")  # Destination is blocked by a tile.
-        if g.engine.gamemap.get_blocking_entity_at(dest_x, dest_y):
+        if g.engine.gamemap.is_blocked(self.dest_x, self.dest_y):
+            # Destination is blocked by a tile or out of bounds.
+            raise game.exceptions.Impossible("That way is blocked.")
+        if self.blocking_entity:
             raise game.exceptions.Impossible("That way is blocked.")  # Destination is blocked by an entity.
 
-        self.entity.x, self.entity.y = dest_x, dest_y
+        self.entity.move(self.dx, self.dy)
 
 
 class Melee(ActionWithDirection):
@@ -7,7 +7,7 @@ from game.components.fighter import Fighter
 
 def die(fighter: Fighter) -> None:
     actor = fighter.entity
-    if actor.try_get(game.components.ai.BaseAI) is None:
+    if not actor.is_alive:
         return
 
     if g.engine.player is actor:
@@ -20,7 +20,9 @@ def die(fighter: Fighter) -> None:
     actor.char = "%"
     actor.color = (191, 0, 0)
     actor.blocks_movement = False
+    actor.gamemap.update_entity(actor)
     actor[game.components.ai.BaseAI] = None
+    actor.is_alive = False
     actor.name = f"remains of {actor.name}"
     actor.render_order = game.render_order.RenderOrder.CORPSE
 
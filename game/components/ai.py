@@ -22,17 +22,15 @@ class BaseAI(Action, Node):
 
         If there is no valid path then returns an empty list.
         """
+        gamemap = self.entity.gamemap
         # Copy the walkable array.
-        cost: NDArray[np.int8] = np.array(self.entity.gamemap.tiles, dtype=np.int8)
+        cost: NDArray[np.int8] = np.logical_not(gamemap.blocked).astype(np.int8)
 
-        for entity in self.entity.gamemap.entities:
-            # Check that an enitiy blocks movement and the cost isn't zero (blocking.)
-            if entity.blocks_movement and cost[entity.x, entity.y]:
-                # Add to the cost of a blocked position.
-                # A lower number means more enemies will crowd behind each other in
-                # hallways.  A higher number means enemies will take longer paths in
-                # order to surround the player.
-                cost[entity.x, entity.y] += 10
+        # Add to the cost of walkable positions blocked by an entity.
+        # A lower number means more enemies will crowd behind each other in
+        # hallways.  A higher number means enemies will take longer paths in
+        # order to surround the player.
+        cost[gamemap.blocked_by_entities & (cost > 0)] += 10
 
         # Create a graph from the cost array and pass that graph to a new pathfinder.
         graph = tcod.path.SimpleGraph(cost=cost, cardinal=2, diagonal=3)
@@ -41,10 +39,10 @@ class BaseAI(Action, Node):
         pathfinder.add_root((self.entity.x, self.entity.y))  # Start position.
 
         # Compute the path to the destination and remove the starting point.
-        path: List[List[int]] = pathfinder.path_to((dest_x, dest_y))[1:].tolist()
+        xs, ys = pathfinder.path_to((dest_x, dest_y))[1:].T.tolist()
 
-        # Convert from List[List[int]] to List[Tuple[int, int]].
-        return [(index[0], index[1]) for index in path]
+        # Pair the x and y columns up as List[Tuple[int, int]].
+        return list(zip(xs, ys))
 
 
 class Idle(BaseAI):
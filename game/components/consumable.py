@@ -21,6 +21,12 @@ class Consumable(Node):
         assert isinstance(self.parent, game.entity.Item)
         return self.parent
 
+    def clone(self) -> Consumable:
+        """Return a new unparented copy of this component.
+        This method must be overridden by Consumable subclasses.
+        """
+        raise NotImplementedError()
+
     def get_action(self, consumer: game.entity.Actor) -> Optional[ActionOrHandler]:
         """Try to return the action for this item."""
         return game.action.ItemAction(consumer, self.item)
@@ -46,6 +52,9 @@ class HealingConsumable(Consumable):
         super().__init__()
         self.amount = amount
 
+    def clone(self) -> HealingConsumable:
+        return HealingConsumable(self.amount)
+
     def activate(self, action: game.action.ItemAction) -> None:
         consumer = action.entity
         amount_recovered = game.combat.heal(consumer.fighter, self.amount)
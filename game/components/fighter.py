@@ -13,6 +13,12 @@ class Fighter(BaseComponent):
         self.base_defense = base_defense
         self.base_power = base_power
 
+    def clone(self) -> Fighter:
+        """Return a new unparented copy of this component."""
+        clone = Fighter(self.max_hp, self.base_defense, self.base_power)
+        clone.hp = self.hp
+        return clone
+
     @property
     def defense(self) -> int:
         return self.base_defense
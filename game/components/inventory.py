@@ -14,14 +14,21 @@ class Inventory(BaseComponent):
         self.capacity = capacity
         self.items: List[game.entity.Item] = []
 
+    def clone(self) -> Inventory:
+        """Return a new unparented copy of this inventory, holding copies of its items."""
+        clone = Inventory(self.capacity)
+        for item in self.items:
+            item_clone = item.clone()
+            item_clone.parent = clone
+            clone.items.append(item_clone)
+        return clone
+
     def drop(self, item: game.entity.Item) -> None:
         """
         Removes an item from the inventory and restores it to the game map, at the player's current location.
         """
         self.items.remove(item)
 
-        item.parent = self.gamemap
-        item.x = self.owner.x
-        item.y = self.owner.y
+        item.place(self.owner.x, self.owner.y, self.gamemap)
 
         g.engine.message_log.add_message(f"You dropped the {item.name}.")
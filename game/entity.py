@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import copy
 import math
 from typing import Optional, Tuple, Type, TypeVar
 
@@ -15,6 +14,8 @@ T = TypeVar("T", bound="Entity")
 class Entity(Node):
     """A generic object to represent players, enemies, items, etc."""
 
+    __slots__ = ("_gamemap", "x", "y", "char", "color", "name", "blocks_movement", "render_order")
+
     def __init__(
         self,
         x: int = 0,
@@ -26,6 +27,11 @@ class Entity(Node):
         render_order: game.render_order.RenderOrder = game.render_order.RenderOrder.CORPSE,
     ):
         super().__init__()
+        # Cached by `gamemap`, cleared when this entity or an ancestor is moved to a new parent.
+        self._gamemap: Optional[game.game_map.GameMap] = None
+        # A GameMap files its entities by `x`, `y`, and `blocks_movement`.  While this entity is on a map, change its
+        # position only with `move` or `place`, and call `gamemap.update_entity(self)` after changing
+        # `blocks_movement`.  Assigning these directly leaves the map's location lookups out of date.
         self.x = x
         self.y = y
         self.char = char
@@ -36,7 +42,13 @@ class Entity(Node):
 
     @property
     def gamemap(self) -> game.game_map.GameMap:
-        return self.get_parent(game.game_map.GameMap)
+        if self._gamemap is None:
+            self._gamemap = self.get_parent(game.game_map.GameMap)
+        return self._gamemap
+
+    def _parent_changed(self) -> None:
+        self._gamemap = None
+        super()._parent_changed()
 
     def __str__(self) -> str:
         """Returns the string representation of the entity.
@@ -47,9 +59,21 @@ class Entity(Node):
             return self.name
         return "Unnamed"
 
+    def clone(self: T) -> T:
+        """Return a new unparented copy of this entity."""
+        return type(self)(
+            self.x,
+            self.y,
+            self.char,
+            self.color,
+            self.name,
+            self.blocks_movement,
+            self.render_order,
+        )
+
     def spawn(self: T, gamemap: Node, x: int, y: int) -> T:
         """Spawn a copy of this instance at the given location."""
-        clone = copy.deepcopy(self)
+        clone = self.clone()
         clone.x = x
         clone.y = y
         clone.parent = gamemap
@@ -59,21 +83,42 @@ class Entity(Node):
         """Place this entitiy at a new location.  Handles moving across GameMaps."""
         self.x = x
         self.y = y
-        self.parent = gamemap
+        if gamemap is self.parent:
+            self._moved()
+        else:
+            # The old and new maps unfile and refile this entity as it is reparented.
+            self.parent = gamemap
 
     def distance(self, x: int, y: int) -> float:
         """
         Return the distance between the current entity and the given (x, y) coordinate.
         """
-        return math.sqrt((x - self.x) ** 2 + (y - self.y) ** 2)
+        return math.hypot(x - self.x, y - self.y)
+
+    def distance_sq(self, x: int, y: int) -> int:
+        """
+        Return the squared distance between the current entity and the given (x, y) coordinate.
+        Compare this against a squared radius for range checks instead of calling `distance`.
+        """
+        dx = x - self.x
+        dy = y - self.y
+        return dx * dx + dy * dy
 
     def move(self, dx: int, dy: int) -> None:
         # Move the entity by a given amount
         self.x += dx
         self.y += dy
+        self._moved()
+
+    def _moved(self) -> None:
+        """Let the GameMap holding this entity know that its position changed."""
+        if isinstance(self.parent, game.game_map.GameMap):
+            self.parent.update_entity(self)
 
 
 class Actor(Entity):
+    __slots__ = ("is_alive", "ai_cls", "_fighter", "_inventory")
+
     def __init__(
         self,
         x: int = 0,
@@ -96,27 +141,44 @@ class Actor(Entity):
             render_order=game.render_order.RenderOrder.ACTOR,
         )
 
+        self.is_alive = True  # True as long as this actor can perform actions, cleared on death.
+
+        self.ai_cls = ai_cls
         ai_cls(self).parent = self
         fighter.parent = self
         if inventory is None:
             inventory = game.components.inventory.Inventory(0)
         inventory.parent = self
 
+        # These components are never swapped out, so they're kept on the actor instead of searched for.
+        self._fighter = fighter
+        self._inventory = inventory
+
+    def clone(self) -> Actor:
+        """Return a new unparented copy of this actor with fresh components."""
+        return Actor(
+            self.x,
+            self.y,
+            self.char,
+            self.color,
+            self.name,
+            ai_cls=self.ai_cls,
+            fighter=self.fighter.clone(),
+            inventory=self.inventory.clone(),
+        )
+
     @property
     def fighter(self) -> game.components.Fighter:
-        return self[game.components.Fighter]
+        return self._fighter
 
     @property
     def inventory(self) -> game.components.inventory.Inventory:
-        return self[game.components.inventory.Inventory]
-
-    @property
-    def is_alive(self) -> bool:
-        """Returns True as long as this actor can perform actions."""
-        return self.try_get(game.components.BaseAI) is not None
+        return self._inventory
 
 
 class Item(Entity):
+    __slots__ = ()
+
     def __init__(
         self,
         x: int = 0,
@@ -143,6 +205,18 @@ class Item(Entity):
         # if equippable:
         #     equippable.parent = self
 
+    def clone(self) -> Item:
+        """Return a new unparented copy of this item with fresh components."""
+        consumable = self.consumable
+        return Item(
+            self.x,
+            self.y,
+            char=self.char,
+            color=self.color,
+            name=self.name,
+            consumable=consumable.clone() if consumable else None,
+        )
+
     @property
     def consumable(self) -> Optional[game.components.Consumable]:
         return self.try_get(game.components.consumable.Consumable)
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import random
-from typing import TYPE_CHECKING, Any, Iterator, Optional, Tuple, Type, TypeVar
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Tuple, Type, TypeVar
 
 import numpy as np
 from numpy.typing import NDArray
@@ -10,6 +10,7 @@ import game.constants
 import game.entity
 from game.constants import SHROUD
 from game.node import Node
+from game.tiles import TileType
 
 if TYPE_CHECKING:
     import game.engine
@@ -30,10 +31,23 @@ class GameMap(Node):
         self.rng = engine.rng
 
         self.tiles: NDArray[np.uint8] = np.zeros((width, height), dtype=np.uint8, order="F")
-
         self.memory: NDArray[Any] = np.full((width, height), fill_value=SHROUD, order="F")
-        self.visible = np.full((width, height), fill_value=False, order="F")  # Tiles the player can currently see
-        self.explored = np.full((width, height), fill_value=False, order="F")  # Tiles the player has seen before
+
+        # Tiles that can not be walked through, with a border of blocked tiles around the map.  See `blocked`.
+        self._blocked_padded = np.full((width + 2, height + 2), fill_value=True, order="F")
+
+        # On a new map the boolean layers share one allocation, each a Fortran-ordered (width, height) view of it.
+        # Pickle saves each layer as its own array, so a loaded map holds separate copies.  Nothing relies on sharing.
+        bool_layers = np.zeros((width, height, 3), dtype=bool, order="F")
+        self.visible = bool_layers[:, :, 0]  # Tiles the player can currently see
+        self.explored = bool_layers[:, :, 1]  # Tiles the player has seen before
+
+        # Entities on this map by tile index `x + y * width`, only occupied tiles have an entry.
+        self._tile_content: Dict[int, List[game.entity.Entity]] = {}
+        # The tile index each entity on this map is filed under in `_tile_content`.
+        self._entity_tiles: Dict[game.entity.Entity, int] = {}
+        # Tiles with at least one entity which blocks movement, maintained with the index above.
+        self._blocked_by_entities = bool_layers[:, :, 2]
 
     @property
     def entities(self) -> Iterator[game.entity.Entity]:
@@ -51,13 +65,69 @@ class GameMap(Node):
     def gamemap(self) -> GameMap:
         return self
 
+    def _child_added(self, child: Node) -> None:
+        if isinstance(child, game.entity.Entity):
+            self._insert_entity(child)
+
+    def _child_removed(self, child: Node) -> None:
+        if isinstance(child, game.entity.Entity):
+            self._remove_entity(child)
+
+    def _insert_entity(self, entity: game.entity.Entity) -> None:
+        i = entity.x + entity.y * self.width
+        self._entity_tiles[entity] = i
+        self._tile_content.setdefault(i, []).append(entity)
+        if entity.blocks_movement:
+            self._blocked_by_entities[entity.x, entity.y] = True
+
+    def _remove_entity(self, entity: game.entity.Entity) -> None:
+        i = self._entity_tiles.pop(entity)
+        content = self._tile_content[i]
+        content.remove(entity)
+        if not content:
+            del self._tile_content[i]
+        y, x = divmod(i, self.width)
+        self._blocked_by_entities[x, y] = any(e.blocks_movement for e in content)
+
+    def update_entity(self, entity: game.entity.Entity) -> None:
+        """Refile an entity on this map.
+
+        Must be called after the entity moves or changes whether it blocks movement.
+        """
+        self._remove_entity(entity)
+        self._insert_entity(entity)
+
+    @property
+    def blocked(self) -> NDArray[np.bool_]:
+        """A boolean array of the tiles which can not be walked through, without the border."""
+        return self._blocked_padded[1:-1, 1:-1]
+
+    @property
+    def blocked_by_entities(self) -> NDArray[np.bool_]:
+        """A boolean array of the tiles which hold an entity that blocks movement."""
+        return self._blocked_by_entities
+
+    def populate_blocked(self) -> None:
+        """Recompute `blocked` from `tiles`, must be called after the tiles are changed."""
+        np.equal(self.tiles, TileType.WALL.value, out=self.blocked)
+
     def in_bounds(self, x: int, y: int) -> bool:
         """Return True if x and y are inside of the bounds of this map."""
         return 0 <= x < self.width and 0 <= y < self.height
 
+    def is_blocked(self, x: int, y: int) -> bool:
+        """Return True if the tile at x,y can not be walked through.
+
+        Positions up to one tile outside of the map are always blocked, so steps from an in-bounds position
+        don't need to be checked with `in_bounds` first.
+        """
+        return bool(self._blocked_padded[x + 1, y + 1])
+
     def entities_at_location(self, x: int, y: int, t: Type[E]) -> Iterator[E]:
-        for entity in self.entities:
-            if isinstance(entity, t) and entity.x == x and entity.y == y:
+        if not self.in_bounds(x, y):
+            return
+        for entity in self._tile_content.get(x + y * self.width, ()):
+            if isinstance(entity, t):
                 yield entity
 
     def actors_at_location(self, x: int, y: int) -> Iterator[game.entity.Actor]:
@@ -70,6 +140,8 @@ class GameMap(Node):
 
     def get_blocking_entity_at(self, x: int, y: int) -> Optional[game.entity.Entity]:
         """Returns an entity that blocks the position at x,y if one exists, otherwise returns None."""
+        if not self.in_bounds(x, y) or not self.blocked_by_entities[x, y]:
+            return None
         for entity in self.entities_at_location(x, y, game.entity.Entity):
             if entity.blocks_movement:
                 return entity
@@ -77,6 +149,8 @@ class GameMap(Node):
         return None
 
     def get_actor_at_location(self, x: int, y: int) -> Optional[game.entity.Actor]:
+        if not self.in_bounds(x, y) or not self.blocked_by_entities[x, y]:
+            return None
         for actor in self.actors_at_location(x, y):
             if actor.blocks_movement:
                 return actor
@@ -1,11 +1,11 @@
 from __future__ import annotations
 
 import random
-from typing import TYPE_CHECKING, Dict, Iterator, List, Tuple
+from typing import TYPE_CHECKING, Dict, List, Tuple
 
-import tcod
+import numpy as np
+from numpy.typing import NDArray
 
-import game.constants
 import game.entity
 import game.entity_factories
 from game.tiles import TileType
@@ -17,11 +17,6 @@ if TYPE_CHECKING:
     import game.engine
 
 
-MAX_ROOMS = game.constants.max_rooms
-MIN_SIZE = game.constants.room_min_size
-MAX_SIZE = game.constants.room_max_size
-
-
 max_monsters_by_floor = [
     (1, 2),
     (4, 3),
@@ -48,6 +43,68 @@ item_chances: Dict[int, List[Tuple[game.entity.Entity, int]]] = {
 }
 
 
+def _carve_tunnel(tiles: NDArray[np.uint8], start: Tuple[int, int], end: Tuple[int, int], rng: random.Random) -> None:
+    """Dig out an L-shaped tunnel between these two points."""
+    x1, y1 = start
+    x2, y2 = end
+    if rng.random() < 0.5:  # 50% chance.
+        corner_x, corner_y = x2, y1  # Move horizontally, then vertically.
+    else:
+        corner_x, corner_y = x1, y2  # Move vertically, then horizontally.
+
+    # Both legs are axis aligned, so each one is a single slice of the tiles array.
+    tiles[min(x1, x2) : max(x1, x2) + 1, corner_y] = TileType.FLOOR.value
+    tiles[corner_x, min(y1, y2) : max(y1, y2) + 1] = TileType.FLOOR.value
+
+
+def _generate_rooms(
+    tiles: NDArray[np.uint8],
+    rooms_out: NDArray[np.int32],
+    rng: random.Random,
+    room_min_size: int,
+    room_max_size: int,
+) -> int:
+    """Carve non-overlapping rooms joined by tunnels into `tiles`.
+
+    The x1, y1, x2, y2 bounds of each room are written to the rows of `rooms_out`, which has one column per
+    attempt.  Returns the number of rooms made.
+
+    This only touches integers and arrays so that it stays independent from the entity and node classes.
+    """
+    width, height = tiles.shape
+    room_x1, room_y1, room_x2, room_y2 = rooms_out
+    previous_center = (0, 0)
+    n = 0
+
+    for _ in range(rooms_out.shape[1]):
+        room_width = rng.randint(room_min_size, room_max_size)
+        room_height = rng.randint(room_min_size, room_max_size)
+
+        x1 = rng.randint(0, width - room_width - 1)
+        y1 = rng.randint(0, height - room_height - 1)
+        x2 = x1 + room_width
+        y2 = y1 + room_height
+
+        # Test all of the other rooms at once and see if they intersect with this one.
+        if np.any((room_x1[:n] <= x2) & (room_x2[:n] >= x1) & (room_y1[:n] <= y2) & (room_y2[:n] >= y1)):
+            continue  # This room intersects, so go to the next attempt.
+        # If there are no intersections then the room is valid.
+
+        # Dig out this rooms inner area.
+        tiles[x1 + 1 : x2, y1 + 1 : y2] = TileType.FLOOR.value
+
+        center = (x1 + x2) // 2, (y1 + y2) // 2
+        if n > 0:
+            # Dig out a tunnel between this room and the previous one.
+            _carve_tunnel(tiles, previous_center, center, rng)
+        previous_center = center
+
+        room_x1[n], room_y1[n], room_x2[n], room_y2[n] = x1, y1, x2, y2
+        n += 1
+
+    return n
+
+
 class GameWorld:
     """
     Holds the settings for the GameMap, and generates new maps when moving down the stairs.
@@ -76,20 +133,9 @@ class GameWorld:
 
         self.current_floor = current_floor
 
-    def __tunnel_between__(self, start: Tuple[int, int], end: Tuple[int, int]) -> Iterator[Tuple[int, int]]:
-        """Return an L-shaped tunnel between these two points."""
-        x1, y1 = start
-        x2, y2 = end
-        if self.engine.rng.random() < 0.5:  # 50% chance.
-            corner_x, corner_y = x2, y1  # Move horizontally, then vertically.
-        else:
-            corner_x, corner_y = x1, y2  # Move vertically, then horizontally.
-
-        # Ge`       `   nerate the coordinates for this tunnel.
-        for x, y in tcod.los.bresenham((x1, y1), (corner_x, corner_y)).tolist():
-            yield x, y
-        for x, y in tcod.los.bresenham((corner_x, corner_y), (x2, y2)).tolist():
-            yield x, y
+        # Bounds of the accepted rooms, one row each for x1, y1, x2, and y2.
+        # This is reused by every floor this world generates.
+        self.room_bounds: NDArray[np.int32] = np.empty((4, max_rooms), dtype=np.int32)
 
     def __get_max_value_for_floor__(self, max_value_by_floor: List[Tuple[int, int]], floor: int) -> int:
         current_value = 0
@@ -157,45 +203,20 @@ class GameWorld:
         dungeon = GameMap(self.engine, self.map_width, self.map_height)
         dungeon.parent = self.engine
 
-        rooms: List[Rect] = []
-        center_of_last_room = (0, 0)
-
-        for _ in range(MAX_ROOMS):
-            room_width = self.engine.rng.randint(MIN_SIZE, MAX_SIZE)
-            room_height = self.engine.rng.randint(MIN_SIZE, MAX_SIZE)
-
-            x = self.engine.rng.randint(0, dungeon.width - room_width - 1)
-            y = self.engine.rng.randint(0, dungeon.height - room_height - 1)
-
-            # "RectangularRoom" class makes rectangles easier to work with.
-            new_room = Rect(x, y, room_width, room_height)
-
-            # Run through the other rooms and see if they intersect with this one.
-            if any(new_room.intersects(other_room) for other_room in rooms):
-                continue  # This room intersects, so go to the next attempt.
-            # If there are no intersections then the room is valid.
-
-            # Dig out this rooms inner area.
-            dungeon.tiles[new_room.inner] = TileType.FLOOR.value
-
-            if len(rooms) == 0:
-                # The first room, where the player starts.
-                dungeon.player_start = new_room.center
-            else:  # All rooms after the first.
-                # Dig out a tunnel between this room and the previous one.
-                for x, y in self.__tunnel_between__(rooms[-1].center, new_room.center):
-                    dungeon.tiles[x, y] = TileType.FLOOR.value
-
-                center_of_last_room = new_room.center
+        n = _generate_rooms(dungeon.tiles, self.room_bounds, self.engine.rng, self.room_min_size, self.room_max_size)
+        rooms = [Rect(x1, y1, x2 - x1, y2 - y1) for x1, y1, x2, y2 in self.room_bounds[:, :n].T.tolist()]
 
-            self.__place_entities__(new_room, dungeon, self.engine.game_world.current_floor)
+        # The first room, where the player starts.
+        dungeon.player_start = rooms[0].center
 
-            dungeon.tiles[center_of_last_room] = TileType.DOWN_STAIRS.value
-            dungeon.downstairs_location = center_of_last_room
+        for room in rooms:
+            self.__place_entities__(room, dungeon, self.current_floor)
 
-            # Finally, append the new room to the list.
-            rooms.append(new_room)
+        # The stairs go in the center of the last room.
+        dungeon.downstairs_location = rooms[-1].center
+        dungeon.tiles[dungeon.downstairs_location] = TileType.DOWN_STAIRS.value
 
+        dungeon.populate_blocked()
         return dungeon
 
     def generate_floor(self) -> None:
@@ -4,22 +4,13 @@ from typing import Tuple
 
 
 class Rect:
+    __slots__ = ("x1", "y1", "x2", "y2", "center")
+
     def __init__(self, x: int, y: int, width: int, height: int):
         self.x1 = x
         self.y1 = y
         self.x2 = x + width
         self.y2 = y + height
 
-    @property
-    def center(self) -> Tuple[int, int]:
-        """Return the center coordinates of the room."""
-        return (self.x1 + self.x2) // 2, (self.y1 + self.y2) // 2
-
-    @property
-    def inner(self) -> Tuple[slice, slice]:
-        """Return the inner area of this room as a 2D array index."""
-        return slice(self.x1 + 1, self.x2), slice(self.y1 + 1, self.y2)
-
-    def intersects(self, other: Rect) -> bool:
-        """Return True if this room overlaps with another RectangularRoom."""
-        return self.x1 <= other.x2 and self.x2 >= other.x1 and self.y1 <= other.y2 and self.y2 >= other.y1
+        # Derived from the bounds above, which should not be changed after construction.
+        self.center: Tuple[int, int] = (self.x1 + self.x2) // 2, (self.y1 + self.y2) // 2  # Center coordinates
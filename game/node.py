@@ -11,6 +11,8 @@ logger = logging.getLogger(__name__)
 class Node:
     """A mixin that allows instances to be organzied into a scene graph."""
 
+    __slots__ = ("_parent", "_children")
+
     def __init__(self, *, parent: Optional[Node] = None) -> None:
         super().__init__()
         self._parent: Optional[Node] = None
@@ -35,6 +37,7 @@ class Node:
                 logger.debug("Moving %r from %r to %r", self, self._parent, new_parent)
             # Remove self from the current parent.
             self._parent._children.remove(self)
+            self._parent._child_removed(self)
             self._parent = None
         else:
             logger.debug("Added %r to %r", self, new_parent)
@@ -42,6 +45,19 @@ class Node:
             # Add self to new_parent.
             self._parent = new_parent
             new_parent._children.add(self)
+            new_parent._child_added(self)
+        self._parent_changed()
+
+    def _parent_changed(self) -> None:
+        """Called after this node or one of its ancestors is moved to a new parent."""
+        for child in self._children:
+            child._parent_changed()
+
+    def _child_added(self, child: Node) -> None:
+        """Called after a child node is added, subclasses can override this to keep an index of their children."""
+
+    def _child_removed(self, child: Node) -> None:
+        """Called after a child node is removed, subclasses can override this to keep an index of their children."""
 
     def get_parent(self, kind: Type[TNode]) -> TNode:
         while True:
@@ -63,7 +79,10 @@ class Node:
         raise TypeError(f"This node has no {kind!r} instances.")
 
     def __setitem__(self, kind: Type[TNode], node: Optional[TNode]) -> None:
-        self._children = {n for n in self._children if not isinstance(n, kind)}
+        removed = {n for n in self._children if isinstance(n, kind)}
+        self._children -= removed
+        for n in removed:
+            self._child_removed(n)
         if node is not None:
             node.parent = self
 
@@ -94,11 +94,6 @@ class GameRenderer(Renderer):
         # The default graphics are of tiles that are visible.
         light = tile_graphics[gamemap.tiles]
 
-        # Apply effects to create a darkened map of tile graphics.
-        dark = gamemap.memory.copy()
-        dark["fg"] //= 2
-        dark["bg"] //= 8
-
         visible = gamemap.visible
         if g.fullbright:
             visible = np.ones_like(visible)
@@ -109,14 +104,14 @@ class GameRenderer(Renderer):
             light[entity.x, entity.y]["ch"] = ord(entity.char)
             light[entity.x, entity.y]["fg"] = entity.color
 
-        # If a tile is in the "visible" array, then draw it with the "light" colors.
-        # If it isn't, but it's in the "explored" array, then draw it with the "dark" colors.
-        # Otherwise, the default graphic is "SHROUD".
-        root_console.rgb[0 : gamemap.width, 0 : gamemap.height] = np.select(
-            condlist=[visible, gamemap.explored],
-            choicelist=[light, dark],
-            default=dark,
-        )
+        # Draw directly into the console, which shares the Fortran order of the map arrays.
+        # Every tile starts as a darkened copy of the remembered tiles, which is "SHROUD" if it was never seen.
+        # If a tile is in the "visible" array, then draw it with the "light" colors instead.
+        map_rgb = root_console.rgb[0 : gamemap.width, 0 : gamemap.height]
+        map_rgb[...] = gamemap.memory
+        map_rgb["fg"] //= 2
+        map_rgb["bg"] //= 8
+        np.copyto(map_rgb, light, where=visible)
 
         for entity in sorted(gamemap.entities, key=lambda x: x.render_order.value):
             if not gamemap.visible[entity.x, entity.y]: